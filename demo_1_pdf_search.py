@@ -3,25 +3,109 @@ Demo 1: PDF Document Search Application
 Uses OpenAI Responses API with File Search tool to search through PDF documents.
 """
 
+import asyncio
+import hashlib
+import logging
 import os
-from openai import OpenAI
-import time
+import sys
+from typing import Optional
+from openai_client import get_async_client
+from streaming import SEP60, consume_stream
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Embedding model and cosine-similarity threshold for the semantic response cache
+EMBEDDING_MODEL = "text-embedding-3-small"
+SEMANTIC_CACHE_THRESHOLD = 0.92
+
+# Static system instructions. Keep them constant (no per-user or per-session data)
+# so the prompt prefix stays identical across calls and hits OpenAI's prompt cache.
+PDF_INSTRUCTIONS = """You are a helpful research assistant that searches through PDF documents.
+Answer questions accurately based on the documents provided.
+Always cite your sources when possible using the document names.
+If you're not sure about something, admit it and stick to the information in the documents."""
+
+# Console banner, built once (SEP60 comes from streaming)
+DASH60 = "-" * 60
+
+
+def _read_file(file_path: str) -> bytes:
+    """Read a file's bytes (blocking; run it with asyncio.to_thread)."""
+    with open(file_path, 'rb') as f:
+        return f.read()
 
 
 class PDFSearchAssistant:
     """A simple assistant that searches through PDF documents using the Responses API."""
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, cache_threshold: float = SEMANTIC_CACHE_THRESHOLD):
         """Initialize the PDF Search Assistant.
 
         Args:
             api_key: OpenAI API key. If not provided, reads from OPENAI_API_KEY env var.
+            cache_threshold: Minimum cosine similarity for a cached answer to be reused
         """
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_async_client(api_key)
         self.vector_store_id = None
-        self.conversation_history = []
+        # Only the last response ID is needed to chain turns via previous_response_id
+        self._last_response_id: Optional[str] = None
+        self.cache_threshold = cache_threshold
+        # Semantic cache entries:
+        # (normalized query embedding, model, vector store ID, response text, response ID)
+        self._semantic_cache = []
+        # Exact cache: sha256 of model, vector store and query -> (response text, response ID)
+        self._exact_cache = {}
+
+    async def _embed(self, query: str) -> np.ndarray:
+        """Embed a query and normalize it so cosine similarity is a single dot product."""
+        response = await self.client.embeddings.create(model=EMBEDDING_MODEL, input=query)
+        embedding = np.asarray(response.data[0].embedding, dtype=np.float32)
+        return embedding / np.linalg.norm(embedding)
+
+    def _cache_key(self, query: str, model: str) -> str:
+        """Key for the exact-match cache tier."""
+        return hashlib.sha256(f"{model}|{self.vector_store_id}|{query}".encode()).hexdigest()
+
+    def _cache_lookup(self, query_embedding: np.ndarray, model: str):
+        """Return the cached (response text, response ID) closest to the query, if similar enough."""
+        best_score, best_entry = -1.0, None
+        for embedding, cached_model, store_id, response_text, response_id in self._semantic_cache:
+            # Same scoping as the exact key: answers only apply to the documents they came from
+            if cached_model != model or store_id != self.vector_store_id:
+                continue
+            score = float(np.dot(query_embedding, embedding))
+            if score > best_score:
+                best_score, best_entry = score, (response_text, response_id)
+
+        if best_score >= self.cache_threshold:
+            return best_entry
+        return None
+
+    async def _semantic_lookup(self, query: str, model: str):
+        """Embed the query and look it up in the semantic tier.
+
+        Returns (query embedding, cached entry or None). The cache is only an
+        optimization, so an embeddings failure (no model access, rate limit, 5xx)
+        is logged and returns (None, None) to let the query go to the live call.
+        """
+        try:
+            query_embedding = await self._embed(query)
+        except Exception as e:
+            logger.warning("Semantic cache unavailable, embedding failed: %s", e)
+            return None, None
+        return query_embedding, self._cache_lookup(query_embedding, model)
+
+    def _log_turn(self, query: str, response_text: str, response_id: Optional[str]):
+        """Log the exchange as the transcript."""
+        logger.info("Query: %s | Response ID: %s | Response: %s", query, response_id, response_text)
 
-    def create_vector_store(self, name: str = "PDF Document Store") -> str:
+    def _record_turn(self, query: str, response_text: str, response_id: Optional[str]):
+        """Keep the response ID for the next turn and log the exchange."""
+        self._last_response_id = response_id
+        self._log_turn(query, response_text, response_id)
+
+    async def create_vector_store(self, name: str = "PDF Document Store") -> str:
         """Create a vector store for PDF documents.
 
         Args:
@@ -31,7 +115,7 @@ class PDFSearchAssistant:
             Vector store ID
         """
         print(f"Creating vector store: {name}")
-        vector_store = self.client.vector_stores.create(
+        vector_store = await self.client.vector_stores.create(
             name=name,
             expires_after={
                 "anchor": "last_active_at",
@@ -42,7 +126,7 @@ class PDFSearchAssistant:
         print(f"✓ Created vector store with ID: {self.vector_store_id}")
         return self.vector_store_id
 
-    def upload_pdf(self, file_path: str) -> dict:
+    async def upload_pdf(self, file_path: str) -> dict:
         """Upload a PDF file to the vector store.
 
         Args:
@@ -58,21 +142,21 @@ class PDFSearchAssistant:
         print(f"Uploading {file_name}...")
 
         try:
-            # Upload file to OpenAI
-            with open(file_path, 'rb') as f:
-                file_response = self.client.files.create(
-                    file=f,
-                    purpose="assistants"
-                )
-
-            # Add file to vector store
-            self.client.vector_stores.files.create(
-                vector_store_id=self.vector_store_id,
-                file_id=file_response.id
+            # Read the file off the event loop, then upload it to OpenAI
+            data = await asyncio.to_thread(_read_file, file_path)
+            file_response = await self.client.files.create(
+                file=(file_name, data),
+                purpose="assistants"
             )
 
-            # Wait for processing
-            time.sleep(2)
+            # Add file to vector store and poll until it is indexed
+            vector_store_file = await self.client.vector_stores.files.create_and_poll(
+                vector_store_id=self.vector_store_id,
+                file_id=file_response.id,
+                poll_interval_ms=200
+            )
+            if vector_store_file.status != "completed":
+                raise RuntimeError(f"Indexing {vector_store_file.status}: {vector_store_file.last_error}")
 
             print(f"✓ Successfully uploaded: {file_name}")
             return {"file": file_name, "status": "success", "file_id": file_response.id}
@@ -81,7 +165,48 @@ class PDFSearchAssistant:
             print(f"✗ Failed to upload {file_name}: {str(e)}")
             return {"file": file_name, "status": "failed", "error": str(e)}
 
-    def search(self, query: str, model: str = "gpt-4o-mini") -> str:
+    async def upload_pdfs(self, file_paths: list) -> dict:
+        """Upload several PDF files to the vector store in a single batch.
+
+        Args:
+            file_paths: Paths to the PDF files
+
+        Returns:
+            Dictionary with batch upload status and file counts
+        """
+        if not self.vector_store_id:
+            raise ValueError("Vector store not created. Call create_vector_store() first.")
+
+        file_names = [os.path.basename(path) for path in file_paths]
+        print(f"Uploading {len(file_paths)} files: {', '.join(file_names)}...")
+
+        try:
+            # Read all files concurrently off the event loop
+            contents = await asyncio.gather(
+                *(asyncio.to_thread(_read_file, path) for path in file_paths)
+            )
+            files = list(zip(file_names, contents))
+
+            # Uploads all files concurrently and polls once until indexing finishes
+            batch = await self.client.vector_stores.file_batches.upload_and_poll(
+                vector_store_id=self.vector_store_id,
+                files=files
+            )
+
+            print(f"✓ Batch {batch.status}: {batch.file_counts.completed} completed, "
+                  f"{batch.file_counts.failed} failed")
+            return {
+                "files": file_names,
+                "status": batch.status,
+                "completed": batch.file_counts.completed,
+                "failed": batch.file_counts.failed
+            }
+
+        except Exception as e:
+            print(f"✗ Failed to upload batch: {str(e)}")
+            return {"files": file_names, "status": "failed", "error": str(e)}
+
+    async def search(self, query: str, model: str = "gpt-4o-mini") -> str:
         """Search through uploaded PDFs using natural language query.
 
         Args:
@@ -94,25 +219,27 @@ class PDFSearchAssistant:
         if not self.vector_store_id:
             raise ValueError("Vector store not created. Call create_vector_store() first.")
 
-        instructions = """You are a helpful research assistant that searches through PDF documents.
-        Answer questions accurately based on the documents provided.
-        Always cite your sources when possible using the document names.
-        If you're not sure about something, admit it and stick to the information in the documents."""
-
-        # Get the previous response ID if we have conversation history
-        previous_response_id = None
-        if self.conversation_history:
-            previous_response_id = self.conversation_history[-1]["response_id"]
-
         print(f"\nSearching: {query}")
-        print("=" * 60)
+        print(SEP60)
+
+        # Reuse the answer to the same query, then to a semantically equivalent one
+        cache_key = self._cache_key(query, model)
+        cached = self._exact_cache.get(cache_key)
+        query_embedding = None
+        if cached is None:
+            query_embedding, cached = await self._semantic_lookup(query, model)
+        if cached:
+            response_text, response_id = cached
+            # Keep chaining from the latest live turn, not the older cached one
+            self._log_turn(query, response_text, response_id)
+            return response_text
 
         # Create response with file search
-        response = self.client.responses.create(
+        response = await self.client.responses.create(
             input=query,
             model=model,
-            instructions=instructions,
-            previous_response_id=previous_response_id,
+            instructions=PDF_INSTRUCTIONS,
+            previous_response_id=self._last_response_id,
             tools=[{
                 "type": "file_search",
                 "vector_store_ids": [self.vector_store_id],
@@ -122,17 +249,17 @@ class PDFSearchAssistant:
 
         # Extract response text
         response_text = response.output[-1].content[0].text
+        self._exact_cache[cache_key] = (response_text, response.id)
+        if query_embedding is not None:
+            self._semantic_cache.append(
+                (query_embedding, model, self.vector_store_id, response_text, response.id))
 
-        # Save to conversation history
-        self.conversation_history.append({
-            "query": query,
-            "response": response_text,
-            "response_id": response.id
-        })
+        # Remember this turn for the next query
+        self._record_turn(query, response_text, response.id)
 
         return response_text
 
-    def search_streaming(self, query: str, model: str = "gpt-4o-mini"):
+    async def search_streaming(self, query: str, model: str = "gpt-4o-mini"):
         """Search with streaming response for real-time output.
 
         Args:
@@ -142,26 +269,30 @@ class PDFSearchAssistant:
         if not self.vector_store_id:
             raise ValueError("Vector store not created. Call create_vector_store() first.")
 
-        instructions = """You are a helpful research assistant that searches through PDF documents.
-        Answer questions accurately based on the documents provided.
-        Always cite your sources when possible using the document names.
-        If you're not sure about something, admit it and stick to the information in the documents."""
-
-        # Get the previous response ID if we have conversation history
-        previous_response_id = None
-        if self.conversation_history:
-            previous_response_id = self.conversation_history[-1]["response_id"]
-
         print(f"\nSearching: {query}")
-        print("=" * 60)
+        print(SEP60)
         print("Response: ", end="", flush=True)
 
+        # Reuse the answer to the same query, then to a semantically equivalent one
+        cache_key = self._cache_key(query, model)
+        cached = self._exact_cache.get(cache_key)
+        query_embedding = None
+        if cached is None:
+            query_embedding, cached = await self._semantic_lookup(query, model)
+        if cached:
+            response_text, response_id = cached
+            print(response_text)
+            print(SEP60)
+            # Keep chaining from the latest live turn, not the older cached one
+            self._log_turn(query, response_text, response_id)
+            return
+
         # Create streaming response
-        stream = self.client.responses.create(
+        stream = await self.client.responses.create(
             input=query,
             model=model,
-            instructions=instructions,
-            previous_response_id=previous_response_id,
+            instructions=PDF_INSTRUCTIONS,
+            previous_response_id=self._last_response_id,
             tools=[{
                 "type": "file_search",
                 "vector_store_ids": [self.vector_store_id],
@@ -170,49 +301,46 @@ class PDFSearchAssistant:
             stream=True
         )
 
-        # Process stream
-        full_text = []
-        current_response_id = None
+        state = await consume_stream(stream, sys.stdout)
 
-        for event in stream:
-            if event.type == "response.output_text.delta":
-                print(event.delta, end="", flush=True)
-                full_text.append(event.delta)
-            elif event.type == "response.completed":
-                current_response_id = event.response.id
+        print("\n" + SEP60)
 
-        print("\n" + "=" * 60)
+        # Without response.completed the text is partial: don't cache it or chain from it
+        current_response_id = state["response_id"]
+        if current_response_id is None:
+            logger.warning("Stream for %r ended without response.completed; not cached", query)
+            return
 
-        # Save to conversation history
-        response_text = ''.join(full_text)
-        self.conversation_history.append({
-            "query": query,
-            "response": response_text,
-            "response_id": current_response_id
-        })
+        # Remember this turn for the next query
+        response_text = state["text"].getvalue()
+        self._exact_cache[cache_key] = (response_text, current_response_id)
+        if query_embedding is not None:
+            self._semantic_cache.append(
+                (query_embedding, model, self.vector_store_id, response_text, current_response_id))
+        self._record_turn(query, response_text, current_response_id)
 
-    def cleanup(self):
+    async def cleanup(self):
         """Delete the vector store and cleanup resources."""
         if self.vector_store_id:
             try:
-                self.client.vector_stores.delete(self.vector_store_id)
+                await self.client.vector_stores.delete(self.vector_store_id)
                 print(f"✓ Cleaned up vector store: {self.vector_store_id}")
             except Exception as e:
                 print(f"✗ Error cleaning up: {e}")
 
 
-def main():
+async def main():
     """Demo application for PDF document search."""
-    print("=" * 60)
+    print(SEP60)
     print("PDF Document Search Demo")
     print("Using OpenAI Responses API with File Search")
-    print("=" * 60)
+    print(SEP60)
 
     # Initialize assistant
     assistant = PDFSearchAssistant()
 
     # Create vector store
-    assistant.create_vector_store("Research Papers Store")
+    await assistant.create_vector_store("Research Papers Store")
 
     # Upload PDF documents
     # Update these paths to your actual PDF files
@@ -222,15 +350,19 @@ def main():
     ]
 
     print("\nUploading documents...")
+    existing_files = []
     for pdf_file in pdf_files:
         if os.path.exists(pdf_file):
-            assistant.upload_pdf(pdf_file)
+            existing_files.append(pdf_file)
         else:
             print(f"⚠ File not found: {pdf_file}")
 
-    print("\n" + "=" * 60)
+    if existing_files:
+        await assistant.upload_pdfs(existing_files)
+
+    print("\n" + SEP60)
     print("Documents uploaded and ready for search!")
-    print("=" * 60)
+    print(SEP60)
 
     # Example searches
     queries = [
@@ -241,14 +373,33 @@ def main():
 
     print("\nRunning example searches...\n")
 
-    for query in queries:
-        assistant.search_streaming(query)
+    async def run_example(query):
+        """Run one example as its own conversation against the shared vector store."""
+        example = PDFSearchAssistant()
+        example.vector_store_id = assistant.vector_store_id
+        return await example.search(query)
+
+    # The example queries are independent, so run them concurrently. Each gets its
+    # own assistant so they don't race on the conversation chain, which leaves the
+    # interactive session below starting from a fresh conversation.
+    responses = await asyncio.gather(
+        *(run_example(query) for query in queries),
+        return_exceptions=True
+    )
+
+    for query, response in zip(queries, responses):
+        print(f"\nQuery: {query}")
+        print(DASH60)
+        if isinstance(response, Exception):
+            print(f"Error: {response}")
+        else:
+            print(response)
         print()
 
     # Interactive mode
-    print("\n" + "=" * 60)
+    print("\n" + SEP60)
     print("Interactive Mode - Type 'quit' to exit")
-    print("=" * 60)
+    print(SEP60)
 
     while True:
         user_query = input("\nYour question: ").strip()
@@ -261,15 +412,15 @@ def main():
             continue
 
         try:
-            assistant.search_streaming(user_query)
+            await assistant.search_streaming(user_query)
         except Exception as e:
             print(f"Error: {e}")
 
     # Cleanup
     print("\nCleaning up resources...")
-    assistant.cleanup()
+    await assistant.cleanup()
     print("Done!")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -3,24 +3,68 @@ Demo 2: Investment Suggestion Generator
 Uses OpenAI Responses API with Code Interpreter to analyze data and generate investment suggestions.
 """
 
+import asyncio
+import io
 import os
-from openai import OpenAI
-from typing import Optional
+import sys
+from openai_client import get_async_client
+import streaming
+from streaming import SEP60
+from typing import Optional, TextIO
+
+# Advisor system prompt, shared by every request. Per-user details belong in the
+# query, never in here, so follow-up turns reuse the cached prompt prefix.
+ADVISOR_INSTRUCTIONS = """You are a professional investment advisor with expertise in:
+- Portfolio diversification and risk management
+- Market analysis and trends
+- Asset allocation strategies
+- Financial planning and retirement savings
+- Stock, bond, ETF, and mutual fund analysis
+
+Guidelines:
+- Provide data-driven insights when possible
+- Use code interpreter to perform calculations and create visualizations
+- Always include risk disclaimers
+- Explain your reasoning clearly
+- Consider the user's risk tolerance and investment timeline
+- Suggest diversified portfolios when appropriate
+
+IMPORTANT DISCLAIMER: Always remind users that this is educational information,
+not professional financial advice. Users should consult with licensed financial
+advisors before making investment decisions."""
+
+
+def _on_output_item_added(event, state: dict):
+    """Announce when the model starts a code interpreter run."""
+    if hasattr(event, 'item') and event.item.type == "code_interpreter_call":
+        state["out"].write("\n\n[Running analysis...]\n")
+        state["out"].flush()
+        state["unflushed"] = 0
+
+
+# Streamed Responses API event type -> handler(event, state): the shared
+# text/completion handlers plus the code interpreter announcement
+STREAM_EVENT_HANDLERS = {
+    **streaming.STREAM_EVENT_HANDLERS,
+    "response.output_item.added": _on_output_item_added,
+}
 
 
 class InvestmentAdvisor:
     """An AI investment advisor that uses the Responses API with Code Interpreter."""
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, output: Optional[TextIO] = None):
         """Initialize the Investment Advisor.
 
         Args:
             api_key: OpenAI API key. If not provided, reads from OPENAI_API_KEY env var.
+            output: Stream that streamed responses are written to. Defaults to sys.stdout.
         """
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_async_client(api_key)
         self.conversation_id = None
+        self.output = output
 
-    def get_investment_suggestion(
+    async def get_investment_suggestion(
         self,
         query: str,
         model: str = "gpt-4o",
@@ -38,25 +82,6 @@ class InvestmentAdvisor:
         Returns:
             Investment suggestion text
         """
-        instructions = """You are a professional investment advisor with expertise in:
-        - Portfolio diversification and risk management
-        - Market analysis and trends
-        - Asset allocation strategies
-        - Financial planning and retirement savings
-        - Stock, bond, ETF, and mutual fund analysis
-
-        Guidelines:
-        - Provide data-driven insights when possible
-        - Use code interpreter to perform calculations and create visualizations
-        - Always include risk disclaimers
-        - Explain your reasoning clearly
-        - Consider the user's risk tolerance and investment timeline
-        - Suggest diversified portfolios when appropriate
-
-        IMPORTANT DISCLAIMER: Always remind users that this is educational information,
-        not professional financial advice. Users should consult with licensed financial
-        advisors before making investment decisions."""
-
         # Setup tools
         tools = []
         if use_code_interpreter:
@@ -67,46 +92,41 @@ class InvestmentAdvisor:
 
         # Create response
         if stream:
-            return self._stream_response(query, instructions, tools, model)
+            return await self._stream_response(query, tools, model)
         else:
-            return self._sync_response(query, instructions, tools, model)
+            return await self._sync_response(query, tools, model)
 
-    def _stream_response(self, query: str, instructions: str, tools: list, model: str):
+    async def _stream_response(self, query: str, tools: list, model: str):
         """Stream the response with real-time output."""
-        print("\n" + "=" * 60)
-        print(f"Query: {query}")
-        print("=" * 60)
-        print("Investment Advisor: ", end="", flush=True)
+        out = self.output or sys.stdout
+        print("\n" + SEP60, file=out)
+        print(f"Query: {query}", file=out)
+        print(SEP60, file=out)
+        print("Investment Advisor: ", end="", flush=True, file=out)
 
-        stream = self.client.responses.create(
+        stream = await self.client.responses.create(
             input=query,
             model=model,
-            instructions=instructions,
+            instructions=ADVISOR_INSTRUCTIONS,
             previous_response_id=self.conversation_id,
             tools=tools,
             stream=True
         )
 
-        full_text = []
-        for event in stream:
-            if event.type == "response.output_text.delta":
-                print(event.delta, end="", flush=True)
-                full_text.append(event.delta)
-            elif event.type == "response.output_item.added":
-                if hasattr(event, 'item') and event.item.type == "code_interpreter_call":
-                    print("\n\n[Running analysis...]", flush=True)
-            elif event.type == "response.completed":
-                self.conversation_id = event.response.id
-
-        print("\n" + "=" * 60)
-        return ''.join(full_text)
-
-    def _sync_response(self, query: str, instructions: str, tools: list, model: str) -> str:
+        state = await streaming.consume_stream(stream, out, STREAM_EVENT_HANDLERS)
+
+        if state["response_id"]:
+            self.conversation_id = state["response_id"]
+
+        print("\n" + SEP60, file=out)
+        return state["text"].getvalue()
+
+    async def _sync_response(self, query: str, tools: list, model: str) -> str:
         """Get synchronous response."""
-        response = self.client.responses.create(
+        response = await self.client.responses.create(
             input=query,
             model=model,
-            instructions=instructions,
+            instructions=ADVISOR_INSTRUCTIONS,
             previous_response_id=self.conversation_id,
             tools=tools
         )
@@ -114,7 +134,7 @@ class InvestmentAdvisor:
         self.conversation_id = response.id
         return response.output[-1].content[0].text
 
-    def analyze_portfolio(
+    async def analyze_portfolio(
         self,
         portfolio_data: dict,
         model: str = "gpt-4o"
@@ -145,9 +165,9 @@ Please provide:
 4. Suggested adjustments (if any)
 5. Expected return projections (with visualizations if helpful)"""
 
-        return self.get_investment_suggestion(query, model=model, stream=True)
+        return await self.get_investment_suggestion(query, model=model, stream=True)
 
-    def compare_investments(
+    async def compare_investments(
         self,
         investment_options: list,
         criteria: str = "risk-adjusted returns",
@@ -177,9 +197,9 @@ Provide:
 5. Recommendation based on different investor profiles
 6. Use visualizations to illustrate key differences"""
 
-        return self.get_investment_suggestion(query, model=model, stream=True)
+        return await self.get_investment_suggestion(query, model=model, stream=True)
 
-    def market_outlook(
+    async def market_outlook(
         self,
         sector: str = "general market",
         model: str = "gpt-4o"
@@ -204,7 +224,7 @@ Please include:
 
 Note: Focus on general principles and educational insights rather than specific stock picks."""
 
-        return self.get_investment_suggestion(query, model=model, stream=True)
+        return await self.get_investment_suggestion(query, model=model, stream=True)
 
     def reset_conversation(self):
         """Reset the conversation history."""
@@ -212,27 +232,16 @@ Note: Focus on general principles and educational insights rather than specific
         print("Conversation reset.")
 
 
-def main():
+async def main():
     """Demo application for investment suggestions."""
-    print("=" * 60)
+    print(SEP60)
     print("Investment Suggestion Generator Demo")
     print("Using OpenAI Responses API with Code Interpreter")
-    print("=" * 60)
+    print(SEP60)
     print("\n⚠️  DISCLAIMER: This is for educational purposes only.")
     print("Not professional financial advice. Consult licensed advisors.")
-    print("=" * 60)
-
-    # Initialize advisor
-    advisor = InvestmentAdvisor()
-
-    # Example 1: General investment question
-    print("\n\n### Example 1: General Investment Advice")
-    advisor.get_investment_suggestion(
-        "I'm 30 years old with moderate risk tolerance. How should I allocate $10,000 for retirement?"
-    )
+    print(SEP60)
 
-    # Example 2: Portfolio analysis
-    print("\n\n### Example 2: Portfolio Analysis")
     portfolio = {
         "age": 35,
         "risk_tolerance": "Moderate to Aggressive",
@@ -240,29 +249,49 @@ def main():
         "holdings": "60% stocks (S&P 500 index), 30% bonds, 10% cash",
         "goals": "Retirement savings, aiming for $2M by age 65"
     }
-    advisor.analyze_portfolio(portfolio)
-
-    # Example 3: Compare investment options
-    print("\n\n### Example 3: Investment Comparison")
-    advisor.compare_investments(
-        investment_options=[
-            "S&P 500 Index Fund (VOO)",
-            "Total Bond Market Fund (BND)",
-            "Real Estate Investment Trust (VNQ)",
-            "Technology Sector ETF (XLK)"
-        ],
-        criteria="risk-adjusted returns for a 10-year investment horizon"
-    )
-
-    # Example 4: Market outlook
-    print("\n\n### Example 4: Market Outlook")
-    advisor.market_outlook(sector="technology sector")
+
+    # Each example is an independent conversation: (title, call on a fresh advisor)
+    examples = [
+        ("Example 1: General Investment Advice", lambda advisor: advisor.get_investment_suggestion(
+            "I'm 30 years old with moderate risk tolerance. How should I allocate $10,000 for retirement?"
+        )),
+        ("Example 2: Portfolio Analysis", lambda advisor: advisor.analyze_portfolio(portfolio)),
+        ("Example 3: Investment Comparison", lambda advisor: advisor.compare_investments(
+            investment_options=[
+                "S&P 500 Index Fund (VOO)",
+                "Total Bond Market Fund (BND)",
+                "Real Estate Investment Trust (VNQ)",
+                "Technology Sector ETF (XLK)"
+            ],
+            criteria="risk-adjusted returns for a 10-year investment horizon"
+        )),
+        ("Example 4: Market Outlook", lambda advisor: advisor.market_outlook(sector="technology sector")),
+    ]
+
+    async def run_example(run):
+        """Run one example on its own advisor, capturing its streamed output."""
+        buffer = io.StringIO()
+        try:
+            await run(InvestmentAdvisor(output=buffer))
+        except Exception as e:
+            buffer.write(f"\nError: {e}\n")
+        return buffer.getvalue()
+
+    # Run the examples concurrently, then print them in order so output isn't interleaved
+    print("\nRunning examples...")
+    outputs = await asyncio.gather(*(run_example(run) for _, run in examples))
+    for (title, _), output in zip(examples, outputs):
+        print(f"\n\n### {title}")
+        print(output, end="")
+
+    # Initialize advisor for the interactive session
+    advisor = InvestmentAdvisor()
 
     # Interactive mode
-    print("\n\n" + "=" * 60)
+    print("\n\n" + SEP60)
     print("Interactive Mode - Ask your investment questions!")
     print("Commands: 'quit' to exit, 'reset' to start new conversation")
-    print("=" * 60)
+    print(SEP60)
 
     while True:
         user_input = input("\nYour question: ").strip()
@@ -279,15 +308,15 @@ def main():
             continue
 
         try:
-            advisor.get_investment_suggestion(user_input)
+            await advisor.get_investment_suggestion(user_input)
         except Exception as e:
             print(f"\nError: {e}")
 
-    print("\n" + "=" * 60)
+    print("\n" + SEP60)
     print("Remember: Always consult with licensed financial advisors")
     print("before making investment decisions!")
-    print("=" * 60)
+    print(SEP60)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
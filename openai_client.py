@@ -0,0 +1,22 @@
+"""
+Shared OpenAI client for the demo applications.
+Reusing one client lets both demos share a single HTTP connection pool.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+from openai import AsyncOpenAI
+
+
+@lru_cache(maxsize=None)
+def get_async_client(api_key: Optional[str] = None) -> AsyncOpenAI:
+    """Return the shared AsyncOpenAI client for the given API key.
+
+    Args:
+        api_key: OpenAI API key. If not provided, reads from OPENAI_API_KEY env var.
+
+    Returns:
+        AsyncOpenAI client, created on first use and reused afterwards
+    """
+    return AsyncOpenAI(api_key=api_key)
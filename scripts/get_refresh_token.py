@@ -8,8 +8,29 @@ logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 # If modifying these scopes, delete the file token.json.
+# Same scopes as tools.py (a superset of gmail_tools.py's), so the refresh token
+# works with either module
 SCOPES = ['https://www.googleapis.com/auth/gmail.readonly',
-          'https://www.googleapis.com/auth/gmail.send']
+          'https://www.googleapis.com/auth/gmail.send',
+          'https://www.googleapis.com/auth/gmail.modify',
+          'https://www.googleapis.com/auth/calendar']
+
+# Instruction text, built once and printed in a single call
+_CREDENTIALS_MISSING = """Error: credentials.json not found!
+Please download your credentials.json from Google Cloud Console:
+1. Go to https://console.cloud.google.com
+2. Select your project
+3. Go to 'APIs & Services' > 'Credentials'
+4. Find your OAuth 2.0 Client ID
+5. Click the download button (looks like a download arrow)
+6. Save the file as 'credentials.json' in this directory"""
+
+_TROUBLESHOOTING = """
+Troubleshooting steps:
+1. Make sure you have the correct credentials.json file
+2. Verify that the Gmail API is enabled in Google Cloud Console
+3. Check that your OAuth consent screen is properly configured
+4. Ensure you're using a Desktop app type OAuth client"""
 
 def get_refresh_token():
     """
@@ -17,14 +38,7 @@ def get_refresh_token():
     This should be run locally once to generate the refresh token.
     """
     if not os.path.exists('credentials.json'):
-        print("Error: credentials.json not found!")
-        print("Please download your credentials.json from Google Cloud Console:")
-        print("1. Go to https://console.cloud.google.com")
-        print("2. Select your project")
-        print("3. Go to 'APIs & Services' > 'Credentials'")
-        print("4. Find your OAuth 2.0 Client ID")
-        print("5. Click the download button (looks like a download arrow)")
-        print("6. Save the file as 'credentials.json' in this directory")
+        print(_CREDENTIALS_MISSING)
         return
     
     try:
@@ -50,10 +64,10 @@ def get_refresh_token():
         
         # Print the credentials
         print("\n=== Your Credentials ===")
-        print("\nAdd these to your .env file:")
-        print(f"GMAIL_CLIENT_ID={creds.client_id}")
-        print(f"GMAIL_CLIENT_SECRET={creds.client_secret}")
-        print(f"GMAIL_REFRESH_TOKEN={creds.refresh_token}")
+        print("\nSet these environment variables (e.g. as CI secrets):")
+        print(f"GOOGLE_CLIENT_ID={creds.client_id}")
+        print(f"GOOGLE_CLIENT_SECRET={creds.client_secret}")
+        print(f"GOOGLE_REFRESH_TOKEN={creds.refresh_token}")
         
         print("\nImportant: Save these credentials securely!")
         print("The refresh token is long-lived but can be revoked if needed.")
@@ -61,11 +75,7 @@ def get_refresh_token():
     except Exception as e:
         print(f"\nError: {str(e)}")
         logger.exception("Detailed error:")
-        print("\nTroubleshooting steps:")
-        print("1. Make sure you have the correct credentials.json file")
-        print("2. Verify that the Gmail API is enabled in Google Cloud Console")
-        print("3. Check that your OAuth consent screen is properly configured")
-        print("4. Ensure you're using a Desktop app type OAuth client")
+        print(_TROUBLESHOOTING)
 
 if __name__ == "__main__":
     get_refresh_token() 
\ No newline at end of file
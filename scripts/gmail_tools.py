@@ -1,96 +1,386 @@
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
+import codecs
+from dataclasses import dataclass, field
+from email.message import EmailMessage
 import os
-from datetime import datetime
-from typing import List, Dict, Optional
+from datetime import datetime, timedelta
+from typing import List, Dict, Iterator, Optional
 import base64
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
+import google_auth_httplib2
+import httplib2
 import json
 
 # If modifying these scopes, delete the file token.json.
 SCOPES = ['https://www.googleapis.com/auth/gmail.readonly',
           'https://www.googleapis.com/auth/gmail.send']
 
-def get_gmail_service():
+# Refresh the access token when it expires within this many seconds
+TOKEN_REFRESH_LEEWAY = 60
+
+# Cached service handle and the authorized HTTP object it sends requests with
+_service = None
+_authed_http = None
+
+# Parsed credentials and the token.json mtime they were loaded from
+_TOKEN_CACHE = {'mtime': None, 'creds': None}
+
+# Token refreshes go through one requests.Session so the connection is reused
+_auth_request = Request()
+
+def _token_mtime() -> Optional[float]:
+    """
+    Return the modification time of token.json, or None if it does not exist.
+    """
+    try:
+        return os.stat('token.json').st_mtime
+    except FileNotFoundError:
+        return None
+
+def _save_credentials(creds):
     """
-    Get or create Gmail API service with proper authentication.
+    Save the credentials for the next run.
+    """
+    with open('token.json', 'w') as token:
+        token.write(creds.to_json())
+    # Our own write should not trigger a reload on the next call
+    _TOKEN_CACHE['mtime'] = _token_mtime()
+    _TOKEN_CACHE['creds'] = creds
+
+def _credentials_from_env():
     """
+    Build credentials from the GOOGLE_REFRESH_TOKEN, GOOGLE_CLIENT_ID and
+    GOOGLE_CLIENT_SECRET environment variables, or return None if any is unset.
+
+    The access token is fetched right away with a single refresh call, so CI
+    runs never need a browser.
+    """
+    refresh_token = os.getenv('GOOGLE_REFRESH_TOKEN')
+    client_id = os.getenv('GOOGLE_CLIENT_ID')
+    client_secret = os.getenv('GOOGLE_CLIENT_SECRET')
+    if not (refresh_token and client_id and client_secret):
+        return None
+    creds = Credentials(token=None, refresh_token=refresh_token,
+                        client_id=client_id, client_secret=client_secret,
+                        token_uri='https://oauth2.googleapis.com/token', scopes=SCOPES)
+    creds.refresh(_auth_request)
+    return creds
+
+def _run_auth_flow():
+    """
+    Run the browser OAuth flow, failing fast when nobody can complete it.
+    """
+    # Notebooks and IDE consoles have no TTY but can still open the browser flow
+    if os.getenv('CI') or os.getenv('GOOGLE_AUTH_NONINTERACTIVE'):
+        raise RuntimeError(
+            'No valid token.json and interactive OAuth is disabled (CI or GOOGLE_AUTH_NONINTERACTIVE); '
+            'set GOOGLE_REFRESH_TOKEN, GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET')
+    flow = InstalledAppFlow.from_client_secrets_file(
+        'credentials.json', SCOPES)
+    return flow.run_local_server(port=0)
+
+def _load_credentials():
+    """
+    Load credentials from token.json, refreshing or re-authenticating if needed.
+
+    The parsed credentials are cached and token.json is only re-read when
+    its mtime changes.
+    """
+    mtime = _token_mtime()
+    if mtime is not None and mtime == _TOKEN_CACHE['mtime']:
+        return _TOKEN_CACHE['creds']
+
     creds = None
-    if os.path.exists('token.json'):
+    if mtime is not None:
         with open('token.json') as token:
             creds = Credentials.from_authorized_user_info(json.load(token), SCOPES)
     
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
+            creds.refresh(_auth_request)
         else:
-            flow = InstalledAppFlow.from_client_secrets_file(
-                'credentials.json', SCOPES)
-            creds = flow.run_local_server(port=0)
-        # Save the credentials for the next run
-        with open('token.json', 'w') as token:
-            token.write(creds.to_json())
+            creds = _credentials_from_env() or _run_auth_flow()
+        _save_credentials(creds)
+    else:
+        _TOKEN_CACHE['mtime'] = mtime
+        _TOKEN_CACHE['creds'] = creds
+
+    return creds
+
+def refresh_if_expired(creds):
+    """
+    Refresh the credentials only when the token expires within TOKEN_REFRESH_LEEWAY seconds.
+    """
+    if not creds.expiry or not creds.refresh_token:
+        return
+    if creds.expiry - datetime.utcnow() < timedelta(seconds=TOKEN_REFRESH_LEEWAY):
+        creds.refresh(_auth_request)
+        _save_credentials(creds)
+
+def get_gmail_service():
+    """
+    Get Gmail API service with proper authentication.
+
+    The service is built once per process and reused. Warm calls only stat
+    token.json (picking up credentials another process wrote) and refresh
+    the access token when it is about to expire.
+    """
+    global _service, _authed_http
+    creds = _load_credentials()
+    if _service is None:
+        # One keep-alive HTTP connection shared by every call on this service
+        _authed_http = google_auth_httplib2.AuthorizedHttp(
+            creds, http=httplib2.Http(timeout=30))
+        _service = build('gmail', 'v1', http=_authed_http,
+                         cache_discovery=False, static_discovery=True)
+    elif _authed_http.credentials is not creds:
+        _authed_http.credentials = creds
+
+    refresh_if_expired(creds)
+    return _service
+
+# Gmail accepts at most 100 calls per batch request
+BATCH_SIZE = 100
+
+# Partial-response mask for messages.get: headers plus the MIME tree (three
+# levels of nested parts) with only the type and body data of each part
+MESSAGE_FIELDS = ('id,payload(headers,mimeType,body/data,'
+                  'parts(mimeType,body/data,parts(mimeType,body/data,parts(mimeType,body/data))))')
+
+# Fields of the dicts returned by read_emails / columns of read_emails_soa
+EMAIL_FIELDS = ('id', 'subject', 'sender', 'date', 'body')
+
+def _decode_body(data: str, max_bytes: Optional[int] = None) -> bytes:
+    """
+    Decode base64url body data to raw bytes, optionally keeping only the
+    first max_bytes.
+
+    Truncation happens on the base64 text (at a 4-character boundary) before
+    decoding, so the discarded tail is never decoded.
+    """
+    if max_bytes is not None and len(data) > (max_bytes + 2) // 3 * 4:
+        data = data[:(max_bytes + 2) // 3 * 4]
+        return base64.urlsafe_b64decode(data)[:max_bytes]
+    return base64.urlsafe_b64decode(data)
+
+def _find_text(payload: Dict, max_bytes: Optional[int] = None) -> bytes:
+    """
+    Return the first text/plain body in a message payload, or b'' if none.
+
+    Walks the MIME tree depth-first with an explicit stack, only descending
+    into multipart/* containers. A single-part message without a text/plain
+    part falls back to its own body.
+    """
+    if 'parts' not in payload:
+        data = payload.get('body', {}).get('data')
+        return _decode_body(data, max_bytes) if data else b""
+
+    stack = [payload]
+    while stack:
+        part = stack.pop()
+        mime_type = part.get('mimeType', '')
+        if mime_type == 'text/plain':
+            data = part.get('body', {}).get('data')
+            if data:
+                return _decode_body(data, max_bytes)
+        elif mime_type.startswith('multipart/'):
+            # Reverse so parts are visited in document order
+            stack.extend(reversed(part.get('parts', [])))
+    return b""
+
+@dataclass(slots=True)
+class Email:
+    """
+    A Gmail message as returned by read_emails_iter.
+
+    The plain-text body is kept as the raw bytes from the API; `body`
+    decodes it (as UTF-8, replacing invalid sequences) on first access.
+    """
+    id: str
+    subject: str
+    sender: str
+    date: str
+    body_bytes: bytes
+    truncated: bool = False
+    _body: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def body(self) -> str:
+        """
+        The plain-text body, decoded once and cached.
+        """
+        if self._body is None:
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            # A truncated body may end mid-character; leave the partial
+            # sequence out instead of turning it into U+FFFD
+            self._body = decoder.decode(self.body_bytes, final=not self.truncated)
+        return self._body
+
+    def to_dict(self) -> Dict:
+        """
+        Return the message as the dict shape read_emails has always returned.
+        """
+        return {name: getattr(self, name) for name in EMAIL_FIELDS}
+
+def _parse_message(msg: Dict, max_body_bytes: Optional[int] = None) -> Email:
+    """
+    Extract the id, headers and plain-text body from a Gmail message resource.
+    """
+    headers = {h['name']: h['value'] for h in msg['payload']['headers']}
+    body = _find_text(msg['payload'], max_body_bytes)
+    return Email(
+        id=msg['id'],
+        subject=headers.get('Subject', ''),
+        sender=headers.get('From', ''),
+        date=headers.get('Date', ''),
+        body_bytes=body,
+        truncated=max_body_bytes is not None and len(body) == max_body_bytes
+    )
+
+def read_emails_iter(query: str = "in:inbox", max_results: int = 10,
+                     include_body: bool = True,
+                     max_body_bytes: Optional[int] = None) -> Iterator[Email]:
+    """
+    Lazily read emails from Gmail using Gmail API.
+
+    Messages are fetched with batch requests (up to 100 per HTTP call) and
+    each batch is only fetched and decoded once the caller consumes it.
+    Errors are raised to the caller.
+    
+    Args:
+        query (str): Gmail search query
+        max_results (int): Maximum number of results to return
+        include_body (bool): Fetch message bodies; if False only the
+            Subject/From/Date headers are requested and 'body' is empty
+        max_body_bytes (Optional[int]): Keep at most this many bytes of
+            each body; None keeps the whole body
+        
+    Yields:
+        Email: Email message details, in the order returned by the search
+    """
+    service = get_gmail_service()
+    results = service.users().messages().list(
+        userId='me', q=query, maxResults=max_results,
+        fields='messages/id,nextPageToken').execute()
+    messages = results.get('messages', [])
+
+    # Partial responses: only request the fields _parse_message reads
+    if include_body:
+        get_kwargs = {'format': 'full',
+                      'fields': MESSAGE_FIELDS}
+    else:
+        get_kwargs = {'format': 'metadata',
+                      'metadataHeaders': ['Subject', 'From', 'Date'],
+                      'fields': 'id,payload/headers'}
+
+    for start in range(0, len(messages), BATCH_SIZE):
+        chunk = messages[start:start + BATCH_SIZE]
+        fetched = {}
+        errors = []
+
+        def collect(request_id, response, exception):
+            if exception is not None:
+                errors.append(exception)
+            else:
+                fetched[request_id] = response
+
+        batch = service.new_batch_http_request(callback=collect)
+        for message in chunk:
+            batch.add(service.users().messages().get(
+                userId='me', id=message['id'], **get_kwargs),
+                request_id=message['id'])
+        batch.execute()
+
+        if errors:
+            raise errors[0]
 
-    return build('gmail', 'v1', credentials=creds)
+        # Keep the order returned by the list call
+        for message in chunk:
+            yield _parse_message(fetched[message['id']], max_body_bytes)
 
-def read_emails(query: str = "in:inbox", max_results: int = 10) -> List[Dict]:
+def read_emails(query: str = "in:inbox", max_results: int = 10,
+                include_body: bool = True,
+                max_body_bytes: Optional[int] = None) -> List[Dict]:
     """
     Read emails from Gmail using Gmail API.
     
     Args:
         query (str): Gmail search query
         max_results (int): Maximum number of results to return
+        include_body (bool): Fetch message bodies; if False only the
+            Subject/From/Date headers are requested and 'body' is empty
+        max_body_bytes (Optional[int]): Keep at most this many bytes of
+            each body; None keeps the whole body
         
     Returns:
         List[Dict]: List of email messages with their details
     """
     try:
-        service = get_gmail_service()
-        results = service.users().messages().list(
-            userId='me', q=query, maxResults=max_results).execute()
-        messages = results.get('messages', [])
-
-        emails = []
-        for message in messages:
-            msg = service.users().messages().get(
-                userId='me', id=message['id']).execute()
-            
-            headers = msg['payload']['headers']
-            subject = next(h['value'] for h in headers if h['name'] == 'Subject')
-            sender = next(h['value'] for h in headers if h['name'] == 'From')
-            date = next(h['value'] for h in headers if h['name'] == 'Date')
-            
-            # Get email body
-            if 'parts' in msg['payload']:
-                parts = msg['payload']['parts']
-                body = ""
-                for part in parts:
-                    if part['mimeType'] == 'text/plain':
-                        if 'data' in part['body']:
-                            body = base64.urlsafe_b64decode(
-                                part['body']['data']).decode()
-                        break
-            else:
-                body = base64.urlsafe_b64decode(
-                    msg['payload']['body']['data']).decode()
-
-            emails.append({
-                'id': message['id'],
-                'subject': subject,
-                'sender': sender,
-                'date': date,
-                'body': body
-            })
-
-        return emails
+        return [email.to_dict() for email in
+                read_emails_iter(query, max_results, include_body, max_body_bytes)]
     except Exception as e:
         return [{'error': str(e)}]
 
+def read_emails_soa(query: str = "in:inbox", max_results: int = 10,
+                    include_body: bool = True) -> Dict[str, List[str]]:
+    """
+    Read emails as parallel lists, one per field (structure of arrays).
+
+    Handy for scanning or filtering many messages at once, or for loading
+    straight into numpy/pandas/pyarrow. Errors are raised to the caller.
+    
+    Args:
+        query (str): Gmail search query
+        max_results (int): Maximum number of results to return
+        include_body (bool): Fetch message bodies; if False 'body' entries are empty
+        
+    Returns:
+        Dict[str, List[str]]: Field name ('id', 'subject', 'sender', 'date',
+            'body') mapped to the values of every message, in the same order
+    """
+    columns = {name: [] for name in EMAIL_FIELDS}
+    for email in read_emails_iter(query, max_results, include_body):
+        for name, values in columns.items():
+            values.append(getattr(email, name))
+    return columns
+
+def _attachment_bytes(content) -> bytes:
+    """
+    Return attachment content as bytes.
+
+    Raw bytes are used as-is; a str is the base64 text the send_email function
+    schema asks for and is decoded once here.
+    """
+    if isinstance(content, str):
+        return base64.b64decode(content)
+    return content
+
+def _build_raw_message(to: str, subject: str, body: str,
+                       attachments: Optional[List[Dict]] = None) -> str:
+    """
+    Build a message and return it base64url-encoded for the Gmail 'raw' field.
+
+    Plain-text emails are sent as a single text part; the message only
+    becomes multipart when attachments are added.
+    """
+    message = EmailMessage()
+    message['To'] = to
+    message['From'] = "me"
+    message['Subject'] = subject
+    message.set_content(body)
+
+    if attachments:
+        for attachment in attachments:
+            message.add_attachment(
+                _attachment_bytes(attachment['content']), maintype='application', subtype='octet-stream',
+                filename=attachment['filename'])
+
+    # base64 output is pure ASCII
+    return base64.urlsafe_b64encode(message.as_bytes()).decode('ascii')
+
 def send_email(to: str, subject: str, body: str, 
                attachments: Optional[List[Dict]] = None) -> Dict:
     """
@@ -100,7 +390,8 @@ def send_email(to: str, subject: str, body: str,
         to (str): Recipient email address
         subject (str): Email subject
         body (str): Email body content
-        attachments (Optional[List[Dict]]): List of attachments with filename and content
+        attachments (Optional[List[Dict]]): List of attachments, each with a
+            'filename' and its 'content' as bytes (or a base64 str)
         
     Returns:
         Dict: Response containing success status and message
@@ -108,23 +399,7 @@ def send_email(to: str, subject: str, body: str,
     try:
         service = get_gmail_service()
         
-        message = MIMEMultipart()
-        message['to'] = to
-        message['from'] = "me"
-        message['subject'] = subject
-        
-        msg = MIMEText(body)
-        message.attach(msg)
-        
-        if attachments:
-            for attachment in attachments:
-                part = MIMEApplication(attachment['content'])
-                part.add_header(
-                    'Content-Disposition', 'attachment', 
-                    filename=attachment['filename'])
-                message.attach(part)
-        
-        raw = base64.urlsafe_b64encode(message.as_bytes()).decode('utf-8')
+        raw = _build_raw_message(to, subject, body, attachments)
         service.users().messages().send(
             userId='me', body={'raw': raw}).execute()
         
@@ -138,6 +413,59 @@ def send_email(to: str, subject: str, body: str,
             "message": f"Error: {str(e)}"
         }
 
+def send_emails(messages: List[Dict]) -> List[Dict]:
+    """
+    Send several emails using Gmail batch requests (up to 100 per HTTP call).
+    
+    Args:
+        messages (List[Dict]): Emails to send, each with 'to', 'subject',
+            'body' and optional 'attachments' keys (same as send_email)
+        
+    Returns:
+        List[Dict]: One result per email, in input order, each containing
+            success status and message
+    """
+    try:
+        service = get_gmail_service()
+    except Exception as e:
+        return [{"success": False, "message": f"Error: {str(e)}"} for _ in messages]
+
+    results = {}
+
+    def collect(request_id, response, exception):
+        if exception is not None:
+            results[request_id] = {
+                "success": False,
+                "message": f"Error: {str(exception)}"
+            }
+        else:
+            results[request_id] = {
+                "success": True,
+                "message": "Email sent successfully!",
+                "message_id": response.get('id')
+            }
+
+    for start in range(0, len(messages), BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=collect)
+        for index, email in enumerate(messages[start:start + BATCH_SIZE], start):
+            request_id = str(index)
+            try:
+                raw = _build_raw_message(
+                    email['to'], email['subject'], email['body'],
+                    email.get('attachments'))
+            except Exception as e:
+                results[request_id] = {"success": False, "message": f"Error: {str(e)}"}
+                continue
+            batch.add(service.users().messages().send(
+                userId='me', body={'raw': raw}), request_id=request_id)
+        try:
+            batch.execute()
+        except Exception as e:
+            for index in range(start, min(start + BATCH_SIZE, len(messages))):
+                results.setdefault(str(index), {"success": False, "message": f"Error: {str(e)}"})
+
+    return [results[str(index)] for index in range(len(messages))]
+
 # Example usage
 if __name__ == "__main__":
     # Example of reading emails
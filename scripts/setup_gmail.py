@@ -11,21 +11,66 @@ logger = logging.getLogger(__name__)
 SCOPES = ['https://www.googleapis.com/auth/gmail.readonly',
           'https://www.googleapis.com/auth/gmail.send']
 
+# Instruction text, built once and printed in a single call
+_CREDENTIALS_INSTRUCTIONS = """
+=== Gmail API Setup ===
+
+Step 1: Get credentials.json from Google Cloud Console
+1. Go to https://console.cloud.google.com
+2. Select your project
+3. Go to 'APIs & Services' > 'Credentials'
+4. Click 'Create Credentials' > 'OAuth client ID'
+5. Choose 'Desktop app' as the application type
+6. Name: 'Gmail API Client'
+7. Click 'Create'
+8. Click the download button (looks like a download arrow)
+9. Save the file as 'credentials.json' in this directory"""
+
+_API_SETUP_INSTRUCTIONS = """
+Step 2: Enable Gmail API
+1. Go to https://console.cloud.google.com
+2. Select your project
+3. Go to 'APIs & Services' > 'Library'
+4. Search for 'Gmail API'
+5. Click 'Enable'
+
+Step 3: Configure OAuth Consent Screen
+1. Go to https://console.cloud.google.com
+2. Select your project
+3. Go to 'APIs & Services' > 'OAuth consent screen'
+4. Choose 'External' user type
+5. Fill in the required information:
+   - App name: 'Gmail API Client'
+   - User support email: your email
+   - Developer contact information: your email
+6. Click 'Save and Continue'
+7. Click 'Save and Continue' (no need to add scopes)
+8. Add your email as a test user
+9. Click 'Save and Continue'
+
+Step 4: Run the authentication flow
+A browser window will open. Please complete the authentication process."""
+
+_SUCCESS_NOTES = """
+✅ Setup completed successfully!
+
+Important Notes:
+1. Keep your credentials.json and token.json files secure
+2. Add both files to your .gitignore
+3. The token.json file contains your refresh token - keep it safe"""
+
+_TROUBLESHOOTING = """
+Troubleshooting steps:
+1. Make sure you have the correct credentials.json file
+2. Verify that the Gmail API is enabled
+3. Check that your OAuth consent screen is properly configured
+4. Ensure you're using a Desktop app type OAuth client"""
+
 def setup_gmail():
     """
     Set up Gmail API credentials.
     """
-    print("\n=== Gmail API Setup ===")
-    print("\nStep 1: Get credentials.json from Google Cloud Console")
-    print("1. Go to https://console.cloud.google.com")
-    print("2. Select your project")
-    print("3. Go to 'APIs & Services' > 'Credentials'")
-    print("4. Click 'Create Credentials' > 'OAuth client ID'")
-    print("5. Choose 'Desktop app' as the application type")
-    print("6. Name: 'Gmail API Client'")
-    print("7. Click 'Create'")
-    print("8. Click the download button (looks like a download arrow)")
-    print("9. Save the file as 'credentials.json' in this directory")
+    print(_CREDENTIALS_INSTRUCTIONS)
     
     if not os.path.exists('credentials.json'):
         print("\nError: credentials.json not found!")
@@ -43,29 +88,7 @@ def setup_gmail():
         
         print("\nFound valid credentials.json")
         
-        print("\nStep 2: Enable Gmail API")
-        print("1. Go to https://console.cloud.google.com")
-        print("2. Select your project")
-        print("3. Go to 'APIs & Services' > 'Library'")
-        print("4. Search for 'Gmail API'")
-        print("5. Click 'Enable'")
-        
-        print("\nStep 3: Configure OAuth Consent Screen")
-        print("1. Go to https://console.cloud.google.com")
-        print("2. Select your project")
-        print("3. Go to 'APIs & Services' > 'OAuth consent screen'")
-        print("4. Choose 'External' user type")
-        print("5. Fill in the required information:")
-        print("   - App name: 'Gmail API Client'")
-        print("   - User support email: your email")
-        print("   - Developer contact information: your email")
-        print("6. Click 'Save and Continue'")
-        print("7. Click 'Save and Continue' (no need to add scopes)")
-        print("8. Add your email as a test user")
-        print("9. Click 'Save and Continue'")
-        
-        print("\nStep 4: Run the authentication flow")
-        print("A browser window will open. Please complete the authentication process.")
+        print(_API_SETUP_INSTRUCTIONS)
         
         # Run the OAuth flow
         flow = InstalledAppFlow.from_client_secrets_file('credentials.json', SCOPES)
@@ -75,20 +98,12 @@ def setup_gmail():
         with open('token.json', 'w') as token:
             token.write(creds.to_json())
         
-        print("\n✅ Setup completed successfully!")
-        print("\nImportant Notes:")
-        print("1. Keep your credentials.json and token.json files secure")
-        print("2. Add both files to your .gitignore")
-        print("3. The token.json file contains your refresh token - keep it safe")
+        print(_SUCCESS_NOTES)
         
     except Exception as e:
         print(f"\nError: {str(e)}")
         logger.exception("Detailed error:")
-        print("\nTroubleshooting steps:")
-        print("1. Make sure you have the correct credentials.json file")
-        print("2. Verify that the Gmail API is enabled")
-        print("3. Check that your OAuth consent screen is properly configured")
-        print("4. Ensure you're using a Desktop app type OAuth client")
+        print(_TROUBLESHOOTING)
 
 if __name__ == "__main__":
     setup_gmail() 
\ No newline at end of file
@@ -13,29 +13,56 @@ logger = logging.getLogger(__name__)
 SCOPES = ['https://www.googleapis.com/auth/gmail.readonly',
           'https://www.googleapis.com/auth/gmail.send']
 
+# Instruction text, built once and printed in a single call
+_SERVICE_ACCOUNT_INSTRUCTIONS = """
+=== Gmail API Service Account Setup ===
+
+Step 1: Create a Service Account in Google Cloud Console
+1. Go to https://console.cloud.google.com
+2. Select your project
+3. Go to 'IAM & Admin' > 'Service Accounts'
+4. Click 'Create Service Account'
+5. Name: 'gmail-api-service'
+6. Description: 'Service account for Gmail API access'
+7. Click 'Create and Continue'
+8. Click 'Continue' (no need to grant access)
+9. Click 'Done'
+
+Step 2: Create and Download Service Account Key
+1. Find your new service account in the list
+2. Click on the service account name
+3. Go to the 'Keys' tab
+4. Click 'Add Key' > 'Create new key'
+5. Choose JSON format
+6. Click 'Create'
+7. Save the downloaded file as 'service-account.json'"""
+
+_DELEGATION_INSTRUCTIONS = """
+Step 3: Enable Domain-Wide Delegation
+1. Go to Google Workspace Admin Console (admin.google.com)
+2. Go to Security > API Controls
+3. Click 'Manage Domain Wide Delegation'
+4. Click 'Add new'"""
+
+_IMPORTANT_NOTES = """
+Important Notes:
+1. Replace 'your-email@yourdomain.com' with the email address you want to use
+2. The service account needs to be granted access to the Gmail API
+3. The user email needs to be in the same domain as your Google Workspace
+4. The service account needs domain-wide delegation enabled"""
+
+_TROUBLESHOOTING = """
+Troubleshooting steps:
+1. Make sure you have the correct service-account.json file
+2. Verify that the Gmail API is enabled in Google Cloud Console
+3. Check that domain-wide delegation is properly configured
+4. Ensure the service account has the necessary permissions"""
+
 def setup_service_account():
     """
     Set up a service account and generate the necessary credentials.
     """
-    print("\n=== Gmail API Service Account Setup ===")
-    print("\nStep 1: Create a Service Account in Google Cloud Console")
-    print("1. Go to https://console.cloud.google.com")
-    print("2. Select your project")
-    print("3. Go to 'IAM & Admin' > 'Service Accounts'")
-    print("4. Click 'Create Service Account'")
-    print("5. Name: 'gmail-api-service'")
-    print("6. Description: 'Service account for Gmail API access'")
-    print("7. Click 'Create and Continue'")
-    print("8. Click 'Continue' (no need to grant access)")
-    print("9. Click 'Done'")
-    print("\nStep 2: Create and Download Service Account Key")
-    print("1. Find your new service account in the list")
-    print("2. Click on the service account name")
-    print("3. Go to the 'Keys' tab")
-    print("4. Click 'Add Key' > 'Create new key'")
-    print("5. Choose JSON format")
-    print("6. Click 'Create'")
-    print("7. Save the downloaded file as 'service-account.json'")
+    print(_SERVICE_ACCOUNT_INSTRUCTIONS)
     
     if not os.path.exists('service-account.json'):
         print("\nError: service-account.json not found!")
@@ -51,11 +78,7 @@ def setup_service_account():
         service_account_email = service_account_info['client_email']
         print(f"\nFound service account: {service_account_email}")
         
-        print("\nStep 3: Enable Domain-Wide Delegation")
-        print("1. Go to Google Workspace Admin Console (admin.google.com)")
-        print("2. Go to Security > API Controls")
-        print("3. Click 'Manage Domain Wide Delegation'")
-        print("4. Click 'Add new'")
+        print(_DELEGATION_INSTRUCTIONS)
         print("5. Client ID:", service_account_info['client_id'])
         print("6. OAuth Scopes (one per line):")
         for scope in SCOPES:
@@ -67,20 +90,12 @@ def setup_service_account():
         print(f"GMAIL_SERVICE_ACCOUNT='{json.dumps(service_account_info)}'")
         print("GMAIL_USER_EMAIL=your-email@yourdomain.com")
         
-        print("\nImportant Notes:")
-        print("1. Replace 'your-email@yourdomain.com' with the email address you want to use")
-        print("2. The service account needs to be granted access to the Gmail API")
-        print("3. The user email needs to be in the same domain as your Google Workspace")
-        print("4. The service account needs domain-wide delegation enabled")
+        print(_IMPORTANT_NOTES)
         
     except Exception as e:
         print(f"\nError: {str(e)}")
         logger.exception("Detailed error:")
-        print("\nTroubleshooting steps:")
-        print("1. Make sure you have the correct service-account.json file")
-        print("2. Verify that the Gmail API is enabled in Google Cloud Console")
-        print("3. Check that domain-wide delegation is properly configured")
-        print("4. Ensure the service account has the necessary permissions")
+        print(_TROUBLESHOOTING)
 
 if __name__ == "__main__":
     setup_service_account() 
\ No newline at end of file
@@ -1,8 +1,9 @@
 import os
 import json
-from datetime import datetime, timedelta
-from google_calendar_tools import (
-    get_calendar_service,
+from datetime import datetime, timedelta, timezone
+from tools import (
+    FastJsonModel,
+    services,
     list_events,
     create_event,
     update_event,
@@ -13,7 +14,7 @@ def test_credentials():
     """Test if credentials.json works and we can authenticate with Google Calendar."""
     try:
         print("Testing credentials and authentication...")
-        service = get_calendar_service()
+        service = services.calendar
         print("✅ Authentication successful!")
         return True
     except Exception as e:
@@ -38,9 +39,11 @@ def test_create_event():
     """Test creating a new event in the primary calendar."""
     try:
         print("\nTesting create_event...")
-        # Create an event tomorrow
-        start = (datetime.utcnow() + timedelta(days=1)).isoformat() + 'Z'
-        end = (datetime.utcnow() + timedelta(days=1, hours=1)).isoformat() + 'Z'
+        # Create an event tomorrow (one clock read so start/end stay exactly 1 hour apart)
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        start_dt = now + timedelta(days=1)
+        end_dt = start_dt + timedelta(hours=1)
+        start, end = start_dt.isoformat(), end_dt.isoformat()
         
         result = create_event(
             summary="Test Event - Please Delete",
@@ -107,10 +110,29 @@ def test_delete_event(event_id):
         print(f"❌ delete_event test failed with exception: {str(e)}")
         return False
 
+def test_non_ascii_request_body():
+    """Test that event bodies with non-ASCII text serialize to a body httplib2 can send."""
+    print("\nTesting non-ASCII request body serialization...")
+    event = {'summary': 'Café meeting €5 🎉', 'location': 'Zürich',
+             'attendees': [{'email': 'jürgen@example.com'}]}
+    try:
+        body = FastJsonModel().serialize(event)
+        # http.client sends str bodies as Latin-1; ASCII-escaped JSON survives that intact
+        body.encode('latin-1')
+        assert json.loads(body) == event
+        print("✅ Non-ASCII body serialization successful!")
+        return True
+    except Exception as e:
+        print(f"❌ Non-ASCII body serialization failed: {str(e)}")
+        return False
+
 def run_tests():
     """Run all tests in sequence."""
     print("=== Google Calendar Tools Test ===")
     
+    # Offline check, no authentication needed
+    test_non_ascii_request_body()
+    
     # Test authentication first
     if not test_credentials():
         print("\n⚠️ Authentication failed, skipping remaining tests.")
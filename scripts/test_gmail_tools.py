@@ -1,5 +1,4 @@
 from gmail_tools import read_emails, send_email
-import base64
 import os
 
 
@@ -40,7 +39,7 @@ def test_send_email_with_attachment():
     test_content = "This is a test file content."
     attachment = {
         'filename': 'test.txt',
-        'content': base64.b64encode(test_content.encode()).decode()
+        'content': test_content.encode()
     }
     
     result = send_email(
@@ -1,15 +1,35 @@
+import io
 import os
-from datetime import datetime, timedelta
+import asyncio
+import threading
+import time
+import copy
+from collections import OrderedDict
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional, Any
 import json
+from itertools import islice
+from operator import itemgetter
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
+from googleapiclient.model import JsonModel
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseUpload
+import google_auth_httplib2
+import httplib2
 import base64
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
+from email.generator import BytesGenerator
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib json module
+    orjson = None
 
 # If modifying these scopes, delete the file token.json.
 SCOPES = [
@@ -19,83 +39,265 @@ SCOPES = [
     'https://www.googleapis.com/auth/calendar'  # Calendar scope
 ]
 
+# Refresh the access token when it expires within this many seconds
+TOKEN_REFRESH_MARGIN = 300
+# Retries (exponential backoff) for idempotent API calls that fail with 429/5xx or a dropped connection
+API_NUM_RETRIES = 3
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+class FastJsonModel(JsonModel):
+    """
+    JsonModel that parses API responses with orjson when it is installed.
+
+    Request bodies keep the stdlib serializer: http.client encodes str bodies
+    as Latin-1, so they must stay ASCII-escaped (orjson emits raw UTF-8 text).
+    """
+
+    def deserialize(self, content):
+        if orjson is None:
+            return super().deserialize(content)
+        # orjson accepts bytes directly, so the response is never decoded to str first
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return content.decode('utf-8') if isinstance(content, bytes) else content
+        if self._data_wrapper and 'data' in body:
+            body = body['data']
+        return body
+
 class GoogleServices:
     _instance = None
     _gmail = None
     _calendar = None
     _credentials = None
+    _http = None
+    _thread_local = threading.local()
+    _refresh_lock = threading.Lock()
+    _init_lock = threading.Lock()
+    # Token refreshes share one requests.Session so the OAuth connection is kept alive
+    _auth_request = Request()
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(GoogleServices, cls).__new__(cls)
-            cls._instance._initialize()
         return cls._instance
 
+    def _ensure_initialized(self):
+        """Authenticate and build the services on first use rather than at import"""
+        if self._credentials is None:
+            with self._init_lock:
+                if self._credentials is None:
+                    self._initialize()
+
     def _initialize(self):
         """Initialize credentials and services"""
-        self._credentials = self._get_credentials()
-        self._gmail = build('gmail', 'v1', credentials=self._credentials)
-        self._calendar = build('calendar', 'v3', credentials=self._credentials)
+        creds = self._get_credentials()
+        # One authorized keep-alive connection pool shared by both services
+        self._http = google_auth_httplib2.AuthorizedHttp(
+            creds, http=httplib2.Http(timeout=30))
+        model = FastJsonModel()
+        self._gmail = build('gmail', 'v1', http=self._http, model=model,
+                            cache_discovery=False, static_discovery=True)
+        self._calendar = build('calendar', 'v3', http=self._http, model=model,
+                               cache_discovery=False, static_discovery=True)
+        # Set last: _ensure_initialized treats non-None credentials as fully built
+        self._credentials = creds
 
     def _get_credentials(self):
         """Get and refresh credentials if needed"""
         creds = None
         if os.path.exists('token.json'):
-            with open('token.json', 'r') as token:
-                creds = Credentials.from_authorized_user_info(json.load(token), SCOPES)
+            with open('token.json', 'rb') as token:
+                info = orjson.loads(token.read()) if orjson else json.load(token)
+            # token.json is shared with gmail_tools.py/setup_gmail.py, which write
+            # Gmail-only tokens; those can't be refreshed to the wider SCOPES
+            missing = set(SCOPES) - set(info.get('scopes') or [])
+            if missing:
+                print(f"token.json is missing scopes {sorted(missing)}, need to re-authenticate")
+                os.replace('token.json', 'token.json.bak')
+                print("Renamed existing token.json to token.json.bak")
+            else:
+                creds = Credentials.from_authorized_user_info(info, SCOPES)
         
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
+                creds.refresh(self._auth_request)
             else:
-                flow = InstalledAppFlow.from_client_secrets_file('credentials.json', SCOPES)
-                creds = flow.run_local_server(port=0)
-            with open('token.json', 'w') as token:
-                token.write(creds.to_json())
+                creds = self._credentials_from_env() or self._run_auth_flow()
+            self._save_credentials(creds)
         
         return creds
 
+    def _credentials_from_env(self):
+        """Build credentials from GOOGLE_REFRESH_TOKEN/GOOGLE_CLIENT_ID/GOOGLE_CLIENT_SECRET, or None"""
+        refresh_token = os.getenv('GOOGLE_REFRESH_TOKEN')
+        client_id = os.getenv('GOOGLE_CLIENT_ID')
+        client_secret = os.getenv('GOOGLE_CLIENT_SECRET')
+        if not (refresh_token and client_id and client_secret):
+            return None
+        creds = Credentials(token=None, refresh_token=refresh_token,
+                            client_id=client_id, client_secret=client_secret,
+                            token_uri='https://oauth2.googleapis.com/token', scopes=SCOPES)
+        # One refresh call for the access token, no browser
+        creds.refresh(self._auth_request)
+        return creds
+
+    def _run_auth_flow(self):
+        """Run the browser OAuth flow, failing fast when nobody can complete it"""
+        # Notebooks and IDE consoles have no TTY but can still open the browser flow
+        if os.getenv('CI') or os.getenv('GOOGLE_AUTH_NONINTERACTIVE'):
+            raise RuntimeError(
+                'No valid token.json and interactive OAuth is disabled (CI or GOOGLE_AUTH_NONINTERACTIVE); '
+                'set GOOGLE_REFRESH_TOKEN, GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET')
+        flow = InstalledAppFlow.from_client_secrets_file('credentials.json', SCOPES)
+        return flow.run_local_server(port=0)
+
+    def _save_credentials(self, creds):
+        """Write token.json atomically so concurrent processes never read a torn file"""
+        tmp_path = f'token.json.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as token:
+            token.write(creds.to_json())
+        os.replace(tmp_path, 'token.json')
+
+    def _ensure_fresh(self):
+        """Refresh the access token before it expires instead of after a 401"""
+        creds = self._credentials
+        if not creds.expiry or not creds.refresh_token:
+            return
+        if (creds.expiry - datetime.utcnow()).total_seconds() < TOKEN_REFRESH_MARGIN:
+            with self._refresh_lock:
+                # Another thread may have refreshed while we waited for the lock
+                if (creds.expiry - datetime.utcnow()).total_seconds() < TOKEN_REFRESH_MARGIN:
+                    creds.refresh(self._auth_request)
+                    self._save_credentials(creds)
+
+    def _thread_http(self):
+        """Get an authorized HTTP object owned by the current thread"""
+        if threading.current_thread() is threading.main_thread():
+            return self._http
+        # httplib2 connections are not thread-safe, so each worker thread keeps its own
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(
+                self._credentials, http=httplib2.Http(timeout=30))
+            self._thread_local.http = http
+        return http
+
+    def execute(self, request, idempotent: bool = True):
+        """
+        Execute an API request on the current thread's connection.
+
+        Idempotent calls (reads, patch) are retried on transient failures.
+        Inserts and sends are not: a retry after a timeout the server already
+        committed would create a duplicate event or email. Deletes are not
+        either, since the retry would get 404/410 for an event that is gone.
+        """
+        num_retries = API_NUM_RETRIES if idempotent else 0
+        return request.execute(http=self._thread_http(), num_retries=num_retries)
+
     @property
     def gmail(self):
         """Get Gmail service"""
+        self._ensure_initialized()
+        self._ensure_fresh()
         return self._gmail
 
     @property
     def calendar(self):
         """Get Calendar service"""
+        self._ensure_initialized()
+        self._ensure_fresh()
         return self._calendar
 
-# Create a global instance
+# Create a global instance (authenticates on first use of .gmail/.calendar)
 services = GoogleServices()
 
 # Gmail Functions
-def read_emails(query: str = "in:inbox", max_results: int = 10) -> List[Dict]:
-    """Read emails from Gmail using Gmail API."""
+# Gmail accepts at most 100 calls per batch request
+GMAIL_BATCH_SIZE = 100
+# messages.get partial-response mask: headers plus type and body data of up to three levels of parts
+GMAIL_MESSAGE_FIELDS = ('id,payload(headers,body/data,'
+                        'parts(mimeType,body/data,parts(mimeType,body/data,parts(mimeType,body/data))))')
+
+def _batched(items, size):
+    """Yield successive lists of at most `size` items."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+def _find_plain(parts: List[Dict]) -> Optional[str]:
+    """Depth-first search for the base64 data of the first non-empty text/plain part."""
+    for part in parts:
+        if part.get('mimeType') == 'text/plain' and part.get('body', {}).get('data'):
+            return part['body']['data']
+        if part.get('parts'):
+            data = _find_plain(part['parts'])
+            if data:
+                return data
+    return None
+
+def read_emails(query: str = "in:inbox", max_results: int = 10,
+                include_body: bool = True) -> List[Dict]:
+    """Read emails from Gmail using Gmail API (messages fetched in batch requests)."""
     try:
-        results = services.gmail.users().messages().list(
-            userId='me', q=query, maxResults=max_results).execute()
+        results = services.execute(services.gmail.users().messages().list(
+            userId='me', q=query, maxResults=max_results,
+            fields='messages/id,nextPageToken'))
         messages = results.get('messages', [])
 
+        # Partial responses: only the fields parsed below
+        if include_body:
+            get_kwargs = {'format': 'full', 'fields': GMAIL_MESSAGE_FIELDS}
+        else:
+            get_kwargs = {'format': 'metadata', 'metadataHeaders': ['Subject', 'From', 'Date'],
+                          'fields': 'id,payload/headers'}
+
+        fetched = {}
+        errors = {}
+
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                errors[request_id] = exception
+            else:
+                fetched[request_id] = response
+
+        # Batches have no num_retries, so re-batch only the gets that failed transiently
+        pending = [message['id'] for message in messages]
+        for attempt in range(API_NUM_RETRIES + 1):
+            errors.clear()
+            for chunk in _batched(pending, GMAIL_BATCH_SIZE):
+                batch = services.gmail.new_batch_http_request()
+                for message_id in chunk:
+                    batch.add(services.gmail.users().messages().get(
+                        userId='me', id=message_id, **get_kwargs),
+                        callback=_collect, request_id=message_id)
+                batch.execute(http=services._thread_http())
+            if not errors:
+                break
+            pending = [message_id for message_id, error in errors.items()
+                       if isinstance(error, HttpError) and error.resp.status in RETRYABLE_STATUSES]
+            # Surface the error that actually stops the retry, not a transient one
+            fatal = [error for message_id, error in errors.items() if message_id not in pending]
+            if fatal:
+                raise fatal[0]
+            if attempt == API_NUM_RETRIES:
+                raise errors[pending[0]]
+            time.sleep(2 ** attempt)
+
         emails = []
         for message in messages:
-            msg = services.gmail.users().messages().get(
-                userId='me', id=message['id']).execute()
+            msg = fetched[message['id']]
             
-            headers = msg['payload']['headers']
-            subject = next(h['value'] for h in headers if h['name'] == 'Subject')
-            sender = next(h['value'] for h in headers if h['name'] == 'From')
-            date = next(h['value'] for h in headers if h['name'] == 'Date')
+            hmap = {h['name']: h['value'] for h in msg['payload'].get('headers', [])}
+            subject = hmap.get('Subject', '')
+            sender = hmap.get('From', '')
+            date = hmap.get('Date', '')
             
-            if 'parts' in msg['payload']:
-                parts = msg['payload']['parts']
-                body = ""
-                for part in parts:
-                    if part['mimeType'] == 'text/plain':
-                        if 'data' in part['body']:
-                            body = base64.urlsafe_b64decode(part['body']['data']).decode()
-                        break
-            else:
-                body = base64.urlsafe_b64decode(msg['payload']['body']['data']).decode()
+            payload = msg['payload']
+            # text/plain may sit inside nested multipart/alternative parts; a
+            # single-part message carries its body on the payload itself
+            data = _find_plain(payload.get('parts', [])) or payload.get('body', {}).get('data')
+            body = base64.urlsafe_b64decode(data).decode('utf-8', 'replace') if data else ""
 
             emails.append({
                 'id': message['id'],
@@ -109,28 +311,46 @@ def read_emails(query: str = "in:inbox", max_results: int = 10) -> List[Dict]:
     except Exception as e:
         return [{'error': str(e)}]
 
+# Messages larger than this are sent as a media upload instead of base64 'raw' JSON
+GMAIL_MEDIA_UPLOAD_THRESHOLD = 4 * 1024 * 1024
+
 def send_email(to: str, subject: str, body: str, 
                attachments: Optional[List[Dict]] = None) -> Dict:
-    """Send an email using Gmail API."""
+    """Send an email using Gmail API (attachment 'content' is bytes or a base64 str)."""
     try:
-        message = MIMEMultipart()
-        message['to'] = to
-        message['from'] = "me"
-        message['subject'] = subject
-        
-        msg = MIMEText(body)
-        message.attach(msg)
-        
         if attachments:
+            message = MIMEMultipart()
+            message.attach(MIMEText(body))
             for attachment in attachments:
-                part = MIMEApplication(attachment['content'])
+                content = attachment['content']
+                if isinstance(content, str):
+                    # Function-call arguments carry the file as base64 text
+                    content = base64.b64decode(content)
+                part = MIMEApplication(content, _subtype='octet-stream')
                 part.add_header('Content-Disposition', 'attachment', 
                               filename=attachment['filename'])
                 message.attach(part)
+        else:
+            # Plain-text sends skip the multipart wrapper and its boundaries
+            message = MIMEText(body)
+        message['to'] = to
+        message['from'] = "me"
+        message['subject'] = subject
         
-        raw = base64.urlsafe_b64encode(message.as_bytes()).decode('utf-8')
-        services.gmail.users().messages().send(
-            userId='me', body={'raw': raw}).execute()
+        # Serialize straight into one buffer (as_bytes() would return another copy)
+        buffer = io.BytesIO()
+        BytesGenerator(buffer, mangle_from_=False).flatten(message)
+        if buffer.tell() > GMAIL_MEDIA_UPLOAD_THRESHOLD:
+            # Upload the RFC 822 bytes as-is: no base64 copy and no JSON body size limit
+            buffer.seek(0)
+            media = MediaIoBaseUpload(buffer, mimetype='message/rfc822', resumable=True)
+            services.execute(services.gmail.users().messages().send(
+                userId='me', body={}, media_body=media), idempotent=False)
+        else:
+            # base64 output is pure ASCII
+            raw = base64.urlsafe_b64encode(buffer.getbuffer()).decode('ascii')
+            services.execute(services.gmail.users().messages().send(
+                userId='me', body={'raw': raw}), idempotent=False)
         
         return {
             "success": True,
@@ -143,27 +363,80 @@ def send_email(to: str, subject: str, body: str,
         }
 
 # Calendar Functions
+@lru_cache(maxsize=2)
+def _utc_iso(bucket_sec: int, offset_days: int) -> str:
+    """RFC 3339 UTC timestamp for bucket_sec + offset_days, formatted once per second."""
+    moment = datetime.fromtimestamp(bucket_sec, timezone.utc) + timedelta(days=offset_days)
+    return moment.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+# Short-lived LRU of list_events results:
+# (calendar_id, time_min, time_max, max_results) -> (expires_at, events)
+LIST_EVENTS_CACHE_TTL = 30
+LIST_EVENTS_CACHE_SIZE = 64
+_events_cache = OrderedDict()
+_events_cache_lock = threading.Lock()
+
+def _resolve_window(time_min: Optional[str], time_max: Optional[str]):
+    """
+    Fill in the default window (now .. now + 7 days) for list_events and list_events_multi.
+
+    "Now" is rounded down to a LIST_EVENTS_CACHE_TTL bucket, so default calls in
+    the same bucket resolve to the same strings (and cache key) and are at most
+    one bucket old.
+    """
+    now = int(time.time()) // LIST_EVENTS_CACHE_TTL * LIST_EVENTS_CACHE_TTL
+    return time_min or _utc_iso(now, 0), time_max or _utc_iso(now, 7)
+
+def _cached_events(key) -> Optional[List[Dict]]:
+    """Return a copy of the cached events for key, or None if missing or expired."""
+    with _events_cache_lock:
+        entry = _events_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del _events_cache[key]
+            return None
+        _events_cache.move_to_end(key)
+        # Copy so callers can mutate the result without touching the cache
+        return copy.deepcopy(entry[1])
+
+def _cache_events(key, events: List[Dict]):
+    """Store events for key, evicting the least recently used entries."""
+    with _events_cache_lock:
+        _events_cache[key] = (time.monotonic() + LIST_EVENTS_CACHE_TTL, copy.deepcopy(events))
+        _events_cache.move_to_end(key)
+        while len(_events_cache) > LIST_EVENTS_CACHE_SIZE:
+            _events_cache.popitem(last=False)
+
+def _invalidate_events(calendar_id: str):
+    """Drop every cached listing of calendar_id after a write to it."""
+    with _events_cache_lock:
+        for key in [key for key in _events_cache if key[0] == calendar_id]:
+            del _events_cache[key]
+
 def list_events(max_results: int = 10, time_min: Optional[str] = None, 
                 time_max: Optional[str] = None, calendar_id: str = 'primary') -> List[Dict]:
-    """List events from Google Calendar."""
+    """List events from Google Calendar (repeat calls within 30 s are served from cache)."""
     try:
-        if not time_min:
-            time_min = datetime.utcnow().isoformat() + 'Z'
-        if not time_max:
-            time_max = (datetime.utcnow() + timedelta(days=7)).isoformat() + 'Z'
+        # Keyed on the resolved window, so default calls in the same bucket share an entry
+        time_min, time_max = _resolve_window(time_min, time_max)
+        cache_key = (calendar_id, time_min, time_max, max_results)
+        cached = _cached_events(cache_key)
+        if cached is not None:
+            return cached
             
-        events_result = services.calendar.events().list(
+        events_result = services.execute(services.calendar.events().list(
             calendarId=calendar_id, 
             timeMin=time_min,
             timeMax=time_max, 
             maxResults=max_results,
             singleEvents=True,
             orderBy='startTime'
-        ).execute()
+        ))
         
         events = events_result.get('items', [])
         
-        return [{
+        events = [{
             'id': event['id'],
             'summary': event.get('summary', 'No title'),
             'start': event['start'].get('dateTime', event['start'].get('date')),
@@ -172,6 +445,8 @@ def list_events(max_results: int = 10, time_min: Optional[str] = None,
             'description': event.get('description', ''),
             'attendees': [attendee.get('email') for attendee in event.get('attendees', [])]
         } for event in events]
+        _cache_events(cache_key, events)
+        return events
         
     except Exception as e:
         return [{'error': str(e)}]
@@ -198,7 +473,9 @@ def create_event(summary: str, start_time: str, end_time: str, description: str
         if attendees:
             event['attendees'] = [{'email': email} for email in attendees]
             
-        event = services.calendar.events().insert(calendarId=calendar_id, body=event).execute()
+        event = services.execute(services.calendar.events().insert(calendarId=calendar_id, body=event),
+                                 idempotent=False)
+        _invalidate_events(calendar_id)
         
         return {
             'success': True,
@@ -223,23 +500,19 @@ def update_event(event_id: str, summary: Optional[str] = None, start_time: Optio
     try:
         service = services.calendar
         
-        event = service.events().get(calendarId=calendar_id, eventId=event_id).execute()
-        
-        if summary:
-            event['summary'] = summary
-        if location:
-            event['location'] = location
-        if description:
-            event['description'] = description
-        if start_time:
-            event['start']['dateTime'] = start_time
-        if end_time:
-            event['end']['dateTime'] = end_time
-        if attendees:
-            event['attendees'] = [{'email': email} for email in attendees]
+        # patch sends only the changed fields, so no get round trip is needed first
+        changes = {'summary': summary, 'location': location, 'description': description}
+        patch_body = {field: value for field, value in changes.items() if value is not None}
+        for field, value in (('start', start_time), ('end', end_time)):
+            if value is not None:
+                # Nested objects are merged, so the event keeps its timeZone
+                patch_body[field] = {'dateTime': value}
+        if attendees is not None:
+            patch_body['attendees'] = [{'email': email} for email in attendees]
             
-        updated_event = service.events().update(
-            calendarId=calendar_id, eventId=event_id, body=event).execute()
+        updated_event = services.execute(service.events().patch(
+            calendarId=calendar_id, eventId=event_id, body=patch_body, fields='id,htmlLink'))
+        _invalidate_events(calendar_id)
         
         return {
             'success': True,
@@ -260,7 +533,9 @@ def delete_event(event_id: str, calendar_id: str = 'primary') -> Dict:
     """
     try:
         service = services.calendar
-        service.events().delete(calendarId=calendar_id, eventId=event_id).execute()
+        services.execute(service.events().delete(calendarId=calendar_id, eventId=event_id),
+                         idempotent=False)
+        _invalidate_events(calendar_id)
         
         return {
             'success': True,
@@ -273,6 +548,80 @@ def delete_event(event_id: str, calendar_id: str = 'primary') -> Dict:
             'message': f'Error: {str(e)}'
         }
 
+# Async Calendar Functions
+# Calendar v3 has no batch mutations, so bulk work runs as concurrent calls in worker threads
+CALENDAR_MAX_CONCURRENCY = 10
+# Concurrent events.list calls issued by list_events_multi
+CALENDAR_LIST_CONCURRENCY = 8
+
+async def alist_events(**kwargs) -> List[Dict]:
+    """List calendar events without blocking the event loop (same arguments as list_events)."""
+    return await asyncio.to_thread(list_events, **kwargs)
+
+async def acreate_event(**kwargs) -> Dict:
+    """Create a calendar event without blocking the event loop (same arguments as create_event)."""
+    return await asyncio.to_thread(create_event, **kwargs)
+
+async def aupdate_event(**kwargs) -> Dict:
+    """Update a calendar event without blocking the event loop (same arguments as update_event)."""
+    return await asyncio.to_thread(update_event, **kwargs)
+
+async def adelete_event(**kwargs) -> Dict:
+    """Delete a calendar event without blocking the event loop (same arguments as delete_event)."""
+    return await asyncio.to_thread(delete_event, **kwargs)
+
+async def _gather_limited(func, calls: List[Dict], max_concurrency: int) -> List[Dict]:
+    """Run func(**kwargs) for every kwargs dict, at most max_concurrency at a time."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run(kwargs):
+        async with semaphore:
+            return await func(**kwargs)
+
+    return await asyncio.gather(*(_run(kwargs) for kwargs in calls))
+
+async def bulk_create_events(events: List[Dict],
+                             max_concurrency: int = CALENDAR_MAX_CONCURRENCY) -> List[Dict]:
+    """Create many events concurrently; each dict holds create_event arguments. Results keep input order."""
+    return await _gather_limited(acreate_event, events, max_concurrency)
+
+async def bulk_update_events(updates: List[Dict],
+                             max_concurrency: int = CALENDAR_MAX_CONCURRENCY) -> List[Dict]:
+    """Update many events concurrently; each dict holds update_event arguments. Results keep input order."""
+    return await _gather_limited(aupdate_event, updates, max_concurrency)
+
+async def bulk_delete_events(event_ids: List[str], calendar_id: str = 'primary',
+                             max_concurrency: int = CALENDAR_MAX_CONCURRENCY) -> List[Dict]:
+    """Delete many events concurrently. Results keep input order."""
+    calls = [{'event_id': event_id, 'calendar_id': calendar_id} for event_id in event_ids]
+    return await _gather_limited(adelete_event, calls, max_concurrency)
+
+async def list_events_multi(calendar_ids: List[str], max_results: int = 10,
+                            time_min: Optional[str] = None, time_max: Optional[str] = None,
+                            max_concurrency: int = CALENDAR_LIST_CONCURRENCY) -> List[Dict]:
+    """
+    List events from several calendars concurrently.
+
+    Returns one flat list sorted by start time; each event carries the
+    'calendar_id' it came from. Calendars that fail contribute an error dict
+    (with its 'calendar_id') after the events.
+    """
+    # Fix the default window once so every calendar is listed over the same range
+    time_min, time_max = _resolve_window(time_min, time_max)
+
+    calls = [{'calendar_id': calendar_id, 'max_results': max_results,
+              'time_min': time_min, 'time_max': time_max} for calendar_id in calendar_ids]
+    results = await _gather_limited(alist_events, calls, max_concurrency)
+
+    events, errors = [], []
+    for calendar_id, calendar_events in zip(calendar_ids, results):
+        for event in calendar_events:
+            event['calendar_id'] = calendar_id
+            (errors if 'error' in event else events).append(event)
+    # Sort once across all calendars
+    events.sort(key=itemgetter('start'))
+    return events + errors
+
 # Example usage
 if __name__ == "__main__":
     # Example of reading emails
@@ -0,0 +1,64 @@
+"""
+Shared helpers for streaming Responses API output in the demo applications.
+Stream events are dispatched through a dict of event type -> handler(event, state).
+"""
+
+import io
+from typing import TextIO
+
+# Flush streamed output after this many buffered characters
+STREAM_FLUSH_CHARS = 256
+
+# Console banner, built once
+SEP60 = "=" * 60
+
+
+def on_text_delta(event, state: dict):
+    """Write a streamed text delta and keep it for the final response text.
+
+    Output is flushed every STREAM_FLUSH_CHARS characters rather than per token.
+    """
+    out = state["out"]
+    out.write(event.delta)
+    state["text"].write(event.delta)
+    state["unflushed"] += len(event.delta)
+    if state["unflushed"] > STREAM_FLUSH_CHARS:
+        out.flush()
+        state["unflushed"] = 0
+
+
+def on_completed(event, state: dict):
+    """Record the ID of the completed response."""
+    state["response_id"] = event.response.id
+
+
+def ignore_event(event, state: dict):
+    """Default handler for stream events a demo does not use."""
+
+
+# Streamed Responses API event type -> handler(event, state); demos extend a copy
+STREAM_EVENT_HANDLERS = {
+    "response.output_text.delta": on_text_delta,
+    "response.completed": on_completed,
+}
+
+
+async def consume_stream(stream, out: TextIO, handlers: dict = STREAM_EVENT_HANDLERS) -> dict:
+    """Dispatch every event of a response stream to its handler.
+
+    Args:
+        stream: Async iterator of Responses API stream events
+        out: Where streamed text is written
+        handlers: Event type -> handler(event, state)
+
+    Returns:
+        The final state: "text" (StringIO of the full text) and "response_id"
+        (None if the stream ended without response.completed)
+    """
+    state = {"out": out, "text": io.StringIO(), "response_id": None, "unflushed": 0}
+    # One dict lookup per event instead of an if/elif chain
+    get_handler = handlers.get
+    async for event in stream:
+        get_handler(event.type, ignore_event)(event, state)
+    out.flush()
+    return state
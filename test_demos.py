@@ -2,12 +2,14 @@
 Quick test script for both demo applications.
 """
 
+import asyncio
 import os
 from demo_1_pdf_search import PDFSearchAssistant
 from demo_2_investment_advisor import InvestmentAdvisor
+from openai_client import get_async_client
 
 
-def test_pdf_search():
+async def _run_pdf_search():
     """Test the PDF search demo."""
     print("=" * 60)
     print("Testing Demo 1: PDF Document Search")
@@ -18,23 +20,23 @@ def test_pdf_search():
         assistant = PDFSearchAssistant()
 
         # Create vector store
-        assistant.create_vector_store("Test PDF Store")
+        await assistant.create_vector_store("Test PDF Store")
 
         # Upload one PDF
         test_pdf = "./notebooks/assets-resources/pdfs/attention_paper.pdf"
         if os.path.exists(test_pdf):
-            assistant.upload_pdf(test_pdf)
+            await assistant.upload_pdf(test_pdf)
 
             # Run a test query
             print("\nRunning test query...")
-            response = assistant.search(
+            response = await assistant.search(
                 "What is this paper about in one sentence?",
                 model="gpt-4o-mini"
             )
             print(f"\nResponse: {response}\n")
 
             # Cleanup
-            assistant.cleanup()
+            await assistant.cleanup()
 
             print("✓ Demo 1 test passed!")
             return True
@@ -47,7 +49,7 @@ def test_pdf_search():
         return False
 
 
-def test_investment_advisor():
+async def _run_investment_advisor():
     """Test the investment advisor demo."""
     print("\n" + "=" * 60)
     print("Testing Demo 2: Investment Advisor")
@@ -59,7 +61,7 @@ def test_investment_advisor():
 
         # Run a simple test query without streaming
         print("\nRunning test query...")
-        response = advisor.get_investment_suggestion(
+        response = await advisor.get_investment_suggestion(
             "What are the key principles of portfolio diversification? Keep it brief.",
             model="gpt-4o-mini",
             use_code_interpreter=False,
@@ -75,6 +77,39 @@ def test_investment_advisor():
         return False
 
 
+def _run_on_new_loop(run):
+    """Run one test coroutine in its own event loop.
+
+    The shared client is bound to the loop it first ran on, so a new loop
+    needs a new client.
+    """
+    get_async_client.cache_clear()
+    return asyncio.run(run())
+
+
+def test_pdf_search():
+    """Sync entry point (e.g. for pytest) for the PDF search demo test."""
+    return _run_on_new_loop(_run_pdf_search)
+
+
+def test_investment_advisor():
+    """Sync entry point (e.g. for pytest) for the investment advisor demo test."""
+    return _run_on_new_loop(_run_investment_advisor)
+
+
+async def run_tests():
+    """Run both demo tests and return (name, passed) pairs."""
+    results = []
+
+    # Test Demo 1
+    results.append(("PDF Search Demo", await _run_pdf_search()))
+
+    # Test Demo 2
+    results.append(("Investment Advisor Demo", await _run_investment_advisor()))
+
+    return results
+
+
 def main():
     """Run all tests."""
     print("\n" + "=" * 60)
@@ -89,13 +124,8 @@ def main():
         print("Set it with: export OPENAI_API_KEY='your-key-here'")
         return
 
-    results = []
-
-    # Test Demo 1
-    results.append(("PDF Search Demo", test_pdf_search()))
-
-    # Test Demo 2
-    results.append(("Investment Advisor Demo", test_investment_advisor()))
+    # Both demos share one client, so run them on the same event loop
+    results = asyncio.run(run_tests())
 
     # Summary
     print("\n" + "=" * 60)